@@ -6,6 +6,7 @@
 ##############################################################
 import os
 import time
+import errno
 import shutil
 import logging
 
@@ -131,9 +132,10 @@ class MASTInput(MASTObj):
             recipe and ingredient folders.
         """
         try:
-            os.mkdir(self.working_directory)
-        except:
-            MASTError(self.__class__.__name__, "Cannot create working directory %s !!!" % self.working_directory)
+            os.makedirs(self.working_directory)
+        except OSError as e:
+            if not (e.errno == errno.EEXIST and os.path.isdir(self.working_directory)):
+                raise MASTError(self.__class__.__name__, "Cannot create working directory %s !!!" % self.working_directory)
 
     def copy_input_file(self):
         """Copy the input file to input.inp
@@ -236,18 +238,12 @@ class MASTInput(MASTObj):
         return
 
     def get_element_string(self):
-        """Get the element string from the structure.
+        """Get the element string from the structure,
+            with element symbols in alphabetical order.
         """
         mystruc = self.input_options.get_item('structure','structure')
-        elemset = set(mystruc.species)
-        elemstr=""
-        elemok=1
-        while elemok == 1:
-            try:
-                elempop = elemset.pop()
-                elemstr = elemstr + elempop.symbol
-            except KeyError:
-                elemok = 0
+        elemsyms = set([elem.symbol for elem in mystruc.species])
+        elemstr = "".join(sorted(elemsyms))
         return elemstr
     def get_element_map_string(self):
         """Get the element string from the elementmap section.
@@ -6,6 +6,7 @@
 ##############################################################
 import os
 import time
+import errno
 import shutil
 import logging
 from MAST.utility import MASTError
@@ -26,8 +27,8 @@ class MASTMon(object):
     """ 
     def __init__(self):
 
-        self.scratch = dirutil.get_mast_scratch_path()
-        self._ARCHIVE = dirutil.get_mast_archive_path()
+        self.scratch = os.path.abspath(dirutil.get_mast_scratch_path())
+        self._ARCHIVE = os.path.abspath(dirutil.get_mast_archive_path())
         self.make_directories() 
         self.logger = loggerutils.get_mast_logger('mast_monitor')
         self.logger.info("%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%")
@@ -39,14 +40,15 @@ class MASTMon(object):
         """Attempt to make scratch and archive directories
             if they do not exist.
         """
-        try:
-            if not os.path.exists(self.scratch):
-                os.makedirs(self.scratch)
-            if not os.path.exists(self._ARCHIVE):
-                os.makedirs(self._ARCHIVE)
-        except:
-            raise MASTError(self.__class__.__name__,
-                    "Error making directory for MASTmon and completed recipes")
+        for mydir in [self.scratch, self._ARCHIVE]:
+            try:
+                os.makedirs(mydir)
+            except OSError as e:
+                #EEXIST is expected, including when another MAST process
+                #creates the directory at the same time.
+                if not (e.errno == errno.EEXIST and os.path.isdir(mydir)):
+                    raise MASTError(self.__class__.__name__,
+                        "Error making directory for MASTmon and completed recipes")
     
     def set_up_recipe_plan(self, fulldir, verbose=0):
         """Set up a recipe plan from the recipe directory.
@@ -96,7 +98,7 @@ class MASTMon(object):
         self.logger.info("Processing recipe %s" % shortdir)
         self.logger.info("--------------------------------")
         my_recipe_plan_object = self.set_up_recipe_plan(fulldir, verbose)
-        os.chdir(fulldir) #need to change directories in order to submit jobs?
+        #set_up_recipe_plan has already changed directories to fulldir
         try:
             my_recipe_plan_object.check_recipe_status(verbose, single_ingred_mode)
         except Exception:
@@ -113,7 +115,7 @@ class MASTMon(object):
         os.chdir(self.scratch)
         if my_recipe_plan_object.status == "C":
             shutil.move(fulldir, self._ARCHIVE)
-            summarypath = "%s/%s/SUMMARY.txt" % (self._ARCHIVE, shortdir)
+            summarypath = os.path.join(self._ARCHIVE, shortdir, "SUMMARY.txt")
             if os.path.isfile(summarypath):
                 self.logger.info("Recipe %s completed." % shortdir)
                 self.logger.info("SUMMARY.txt below:")
@@ -125,24 +127,37 @@ class MASTMon(object):
         self.logger.info("-----------------------------")
 
 
+    def get_recipe_dirs(self):
+        """Get the recipe directories in MAST_SCRATCH.
+            Only the top level of MAST_SCRATCH is listed; recipe
+            subdirectories are not walked.
+            Returns:
+                <list of str>: sorted full paths of recipe directories
+        """
+        recipe_dirs = list()
+        for subdir in dirutil.immediate_subdirs(self.scratch):
+            fulldir = os.path.join(self.scratch, subdir)
+            if fulldir == self._ARCHIVE:
+                continue
+            recipe_dirs.append(fulldir)
+        return recipe_dirs
+
     def run(self, verbose=0, single_recipe=0, single_ingred=0):
         """Run the MAST monitor.
         """
         if (single_ingred == 0) and ("dagman" in dirutil.get_mast_platform()):
             return None #Do not auto-run from __init__ method for CHTC/DAGMan
         curdir = os.getcwd()
-        try:
-            os.chdir(self.scratch)    
-        except:
-            os.chdir(curdir)
+        if not os.path.isdir(self.scratch):
             errorstr = "Could not change directories to MAST_SCRATCH at %s" % self.scratch
             raise MASTError(self.__class__.__name__, errorstr)
+        os.chdir(self.scratch)
         
         #dirutil.lock_directory(self.scratch, 1) # Wait 5 seconds
         #Directory is now locked by mast initially, but gets
         #unlocked at the end of the mastmon run.
         if single_ingred == 0: 
-            recipe_dirs = dirutil.walkdirs(self.scratch,1,1)
+            recipe_dirs = self.get_recipe_dirs()
         else:
             recipe_dirs = list()
             recipe_dirs.append(single_recipe)
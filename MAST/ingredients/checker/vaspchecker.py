@@ -4,7 +4,7 @@
 # Maintainer: Tam Mayeshiba
 # Last updated: 2014-04-25
 ##############################################################
-from pymatgen.io.vasp import Poscar, Outcar, Potcar, Incar, Kpoints, Vasprun
+from pymatgen.io.vasp import Poscar, Potcar, Incar, Kpoints, Vasprun
 from pymatgen.core.sites import PeriodicSite
 from pymatgen.core.structure import Structure
 from MAST.utility import dirutil
@@ -14,11 +14,20 @@ from MAST.utility.metadata import Metadata
 from MAST.ingredients.pmgextend.structure_extensions import StructureExtensions
 from MAST.ingredients.pmgextend.atom_index import AtomIndex
 import os
+import re
 import shutil
 import logging
 import subprocess
 import numpy as np
 from MAST.ingredients.checker import BaseChecker
+
+_USER_TIME_RE = re.compile(r"User time\s*\(sec\)\s*:\s*([0-9.]+)")
+
+#is_complete results keyed by full OUTCAR path; each entry is reused
+#while the OUTCAR modification time and size and the IBRION and NSW
+#keywords are unchanged.
+_outcar_cache = dict()
+
 class VaspChecker(BaseChecker):
     """VASP checker functions
     """
@@ -224,26 +233,51 @@ class VaspChecker(BaseChecker):
 
     def is_complete(self):
         """Check if single VASP non-NEB calculation is complete.
+            The result is cached until the OUTCAR changes, so that
+            finished calculations are not re-parsed on every check.
         """
-        usertime=False
-        reachedaccuracy=False
         opath = os.path.join(self.keywords['name'],"OUTCAR")
         if not os.path.isfile(opath):
             self.logger.info("No OUTCAR at %s; not complete." % opath)
             return False
+        mystat = os.stat(opath)
+        pkeys = self.keywords['program_keys']
+        cachekey = (mystat.st_mtime, mystat.st_size,
+                    str(pkeys.get('ibrion')), str(pkeys.get('nsw')))
+        fullpath = os.path.abspath(opath)
+        cached = _outcar_cache.get(fullpath)
+        if (cached is not None) and (cached[0] == cachekey):
+            self.logger.debug("Using cached completion status for OUTCAR at %s" % opath)
+            return cached[1]
+        complete = self._check_outcar_complete(opath)
+        _outcar_cache[fullpath] = (cachekey, complete)
+        return complete
 
-        myoutcar = Outcar(opath)
+    def _check_outcar_complete(self, opath):
+        """Check the OUTCAR of a single VASP non-NEB calculation
+            for completion.
+            Args:
+                opath <str>: OUTCAR path
+        """
+        usertime=False
+        reachedaccuracy=False
         
         #hw 04/19/13
+        #The timing block is written at the very end of the OUTCAR,
+        #so only the tail of the file is read instead of parsing it all.
         try:
-            if myoutcar.run_stats['User time (sec)'] > 0:
-                usertime=True
-            else:
-                usertime=False
-        except KeyError:
+            with open(opath, "rb") as ofile:
+                ofile.seek(max(0, os.path.getsize(opath) - 8192))
+                otail = ofile.read()
+        except (IOError, OSError):
+            otail = ""
+        usermatch = _USER_TIME_RE.search(otail)
+        if (usermatch is not None) and (float(usermatch.group(1)) > 0):
+            usertime=True
+        else:
             usertime=False
         
-        reachgrep=subprocess.Popen('grep "reached required accuracy" %s' % opath, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+        reachgrep=subprocess.Popen(['grep', 'reached required accuracy', opath], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         reachrpt=reachgrep.communicate()[0]
         reachgrep.wait()
         if reachrpt=='':
@@ -276,7 +310,7 @@ class VaspChecker(BaseChecker):
         
         #For static runs, make an additional check for just electronic convergence.
         if isstatic:
-            reachgrep=subprocess.Popen('grep "EDIFF is reached" %s' % opath, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
+            reachgrep=subprocess.Popen(['grep', 'EDIFF is reached', opath], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             reachrpt=reachgrep.communicate()[0]
             reachgrep.wait()
             if reachrpt=='':
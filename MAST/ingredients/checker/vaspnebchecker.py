@@ -102,14 +102,22 @@ class VaspNEBChecker(VaspChecker):
         """
         dirname = self.keywords['name']
         numim = int(self.keywords['program_keys']['mast_neb_settings']['images'])
-        imct=1
-        while imct <= numim:
-            num_str = str(imct).zfill(2)
-            impath = os.path.join(dirname, num_str)
+        impaths = [os.path.join(dirname, "%02d" % imct) for imct in range(1, numim+1)]
+        #Make sure every image has written an OUTCAR before parsing any
+        #of them, so that an unstarted image does not cost a full
+        #OUTCAR parse of each image before it.
+        for impath in impaths:
+            opath = os.path.join(impath, "OUTCAR")
+            if not os.path.isfile(opath):
+                self.logger.info("No OUTCAR at %s; not complete." % opath)
+                return False
+            if os.path.getsize(opath) == 0:
+                self.logger.info("Empty OUTCAR at %s; not complete." % opath)
+                return False
+        for impath in impaths:
             singlechecker=VaspChecker(name=impath,program_keys=self.keywords['program_keys'],structure=self.keywords['structure'])
             if not singlechecker.is_complete():
                 return False
-            imct = imct + 1
         return True
 
     def is_ready_to_run(self):
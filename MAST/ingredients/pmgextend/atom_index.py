@@ -6,6 +6,8 @@
 ##############################################################
 import numpy as np
 import logging
+import errno
+from collections import OrderedDict
 from MAST.utility.dirutil import *
 from MAST.utility import MASTError
 from MAST.utility import MASTFile
@@ -30,6 +32,7 @@ class AtomIndex(MASTObj):
         MASTObj.__init__(self, allowed_keys, **kwargs)            
         self.logger = loggerutils.get_mast_logger("atom_indexing")
         self.sdir = self.keywords['structure_index_directory']
+        self._atom_table = None
         self.input_options = self.keywords['input_options']
         if self.input_options == None:
             return
@@ -37,6 +40,8 @@ class AtomIndex(MASTObj):
         self.logger.info("Scaling: %s" % self.scaling)
         if self.scaling == None:
             self.scaling = dict()
+        self.scales = list(self.scaling.keys())
+        self.scales.append("") #unscaled
         self.startstr = self.input_options.get_item('structure','structure')
         self.atomcount=1
         return
@@ -44,26 +49,24 @@ class AtomIndex(MASTObj):
     def make_structure_index_directory(self):
         """Make structure index directory
         """
-        if os.path.isdir(self.sdir):
-            import time
-            time.sleep(1)
-        if os.path.isdir(self.sdir):
-            raise MASTError(self.__class__.__name__, "Structure index directory already exists!")
-        os.mkdir(self.sdir)
+        try:
+            os.mkdir(self.sdir)
+        except OSError as e:
+            if e.errno == errno.EEXIST:
+                raise MASTError(self.__class__.__name__, "Structure index directory already exists!")
+            raise
         return
 
     def write_undefected_atom_indices(self):
         """Write undefected atom indices, including scaled indices.
             Also write an undefected manifest file.
         """
-        scales = self.scaling.keys()
-        scales.append("")
-        for scaling_label in scales:
+        for scaling_label in self.scales:
             if scaling_label == "":
-                mySE=SE(struc_work1=self.startstr.copy())
+                mySE=SE(struc_work1=self.startstr)
                 mystruc=mySE.keywords['struc_work1']
             else:
-                mySE=SE(struc_work1=self.startstr.copy(), scaling_size=self.scaling[scaling_label]["mast_size"])
+                mySE=SE(struc_work1=self.startstr, scaling_size=self.scaling[scaling_label]["mast_size"])
                 mystruc=mySE.scale_structure()
             alist=list()
             manname=os.path.join(self.sdir,"manifest_%s__" % scaling_label)
@@ -72,10 +75,11 @@ class AtomIndex(MASTObj):
                 aname="atom_index_%s" % akey
                 aname = os.path.join(self.sdir, aname)
                 ameta = Metadata(metafile=aname)
-                ameta.write_data("atom_index",akey)
-                ameta.write_data("original_frac_coords", site.frac_coords)
-                ameta.write_data("element", site.species_string)
-                ameta.write_data("scaling_label", scaling_label)
+                ameta.write_bulk([("atom_index", akey),
+                        ("original_frac_coords", site.frac_coords),
+                        ("element", site.species_string),
+                        ("scaling_label", scaling_label)])
+                self._add_to_atom_table(akey, site.frac_coords, site.species_string, scaling_label)
                 alist.append(akey)
             self.write_manifest_file(alist,manname)
         return 
@@ -94,7 +98,9 @@ class AtomIndex(MASTObj):
                 atomidx <str>: atom index string
         """
         spad=16
-        atomidx=hex(aint).zfill(spad)
+        #keep the zero-padded "0x" form that existing structure index
+        #directories use; format directly so that longs get no "L"
+        atomidx=("0x%x" % aint).zfill(spad)
         return atomidx
     
     def write_manifest_file(self, aidxlist, fname):
@@ -104,8 +110,7 @@ class AtomIndex(MASTObj):
                 fname <str>: File name
         """
         myfile = open(fname, 'wb')
-        for aidx in aidxlist:
-            myfile.write("%s\n" % aidx)
+        myfile.write("".join(["%s\n" % aidx for aidx in aidxlist]))
         myfile.close()
         return
 
@@ -117,16 +122,14 @@ class AtomIndex(MASTObj):
             return None
         dlabels=defect_dict.keys()
         
-        scales = self.scaling.keys()
-        scales.append("")
-        for scaling_label in scales:
+        for scaling_label in self.scales:
             alist=list(self.read_manifest_file("%s/manifest_%s__" % (self.sdir, scaling_label)))
             if scaling_label == "":
-                mySE=SE(struc_work1=self.startstr.copy())
+                mySE=SE(struc_work1=self.startstr)
             else:
-                mySE=SE(struc_work1=self.startstr.copy(), scaling_size=self.scaling[scaling_label]["mast_size"])
+                mySE=SE(struc_work1=self.startstr, scaling_size=self.scaling[scaling_label]["mast_size"])
             for dlabel in dlabels:
-                dlist = list(alist)
+                dlist = OrderedDict((aidx, None) for aidx in alist) #ordered set
                 manname=os.path.join(self.sdir,"manifest_%s_%s_" % (scaling_label, dlabel))
                 dsubkeys=defect_dict[dlabel].keys()
                 for dsubkey in dsubkeys:
@@ -148,13 +151,14 @@ class AtomIndex(MASTObj):
                                 aname="atom_index_%s" % akey
                                 aname = os.path.join(self.sdir, aname)
                                 ameta = Metadata(metafile=aname)
-                                ameta.write_data("atom_index",akey)
-                                ameta.write_data("original_frac_coords", dcoords)
-                                ameta.write_data("element", delement)
-                                ameta.write_data("scaling_label", scaling_label)
-                                dlist.append("%s;int" % akey) #interstitial label
+                                ameta.write_bulk([("atom_index", akey),
+                                        ("original_frac_coords", dcoords),
+                                        ("element", delement),
+                                        ("scaling_label", scaling_label)])
+                                self._add_to_atom_table(akey, dcoords, delement, scaling_label)
+                                dlist["%s;int" % akey] = None #interstitial label
                             else:
-                                dlist.append("%s;int" % didx)
+                                dlist["%s;int" % didx] = None
                         elif dtype == "vacancy":
                             didx=self.find_frac_coord_in_atom_indices(dcoords, 
                                     include_orig="only",
@@ -163,23 +167,18 @@ class AtomIndex(MASTObj):
                                     find_multiple=False, 
                                     tol=0.001)
                             try:
-                                dlist.remove(didx)
-                            except ValueError:
-                                raise MASTError(self.__class__.__name__, "For defect %s, cannot remove atom index %s from list: %s" % (dlabel, didx, dlist))
+                                del dlist[didx]
+                            except KeyError:
+                                raise MASTError(self.__class__.__name__, "For defect %s, cannot remove atom index %s from list: %s" % (dlabel, didx, list(dlist)))
                         elif dtype in ["substitution","antisite"]:
-                            didxlist=self.find_frac_coord_in_atom_indices(dcoords, 
-                                include_orig="only",
-                                element="", 
-                                scaling_label=scaling_label, 
-                                find_multiple=True, 
-                                tol=0.001) #leave element empty; just search coords
+                            didxelems=self._find_orig_frac_coord_elements_in_atom_table(dcoords, 
+                                scaling_label, 
+                                0.001) #just search coords; elements come along
                             idxtorepl=list()
-                            for didx in didxlist:
-                                dmeta = Metadata(metafile="%s/atom_index_%s" % (self.sdir, didx))
-                                dmetaelem = dmeta.read_data("element")
+                            for (didx, dmetaelem) in didxelems:
                                 if not (delement == dmetaelem):
                                     if didx in dlist:
-                                        dlist.remove(didx)
+                                        del dlist[didx]
                                         idxtorepl.append(didx)
                             if len(idxtorepl) > 1:
                                 raise MASTError(self.__class__.__name__, "Interstitial %s is attempting to replace more than one atom: %s" % (dlabel, idxtorepl))
@@ -194,26 +193,23 @@ class AtomIndex(MASTObj):
                                 aname="atom_index_%s" % akey
                                 aname = os.path.join(self.sdir, aname)
                                 ameta = Metadata(metafile=aname)
-                                ameta.write_data("atom_index",akey)
-                                ameta.write_data("original_frac_coords", dcoords)
-                                ameta.write_data("element", delement) #sub element here
-                                ameta.write_data("scaling_label", scaling_label)
-                                dlist.append("%s;%s" % (akey, idxtorepl[0]))
+                                ameta.write_bulk([("atom_index", akey),
+                                        ("original_frac_coords", dcoords),
+                                        ("element", delement), #sub element here
+                                        ("scaling_label", scaling_label)])
+                                self._add_to_atom_table(akey, dcoords, delement, scaling_label)
+                                dlist["%s;%s" % (akey, idxtorepl[0])] = None
                             else:
-                                dlist.append("%s;%s" % (didxsub, idxtorepl[0]))
-                self.write_manifest_file(dlist, manname)
+                                dlist["%s;%s" % (didxsub, idxtorepl[0])] = None
+                self.write_manifest_file(list(dlist), manname)
         return 
     
     def read_manifest_file(self, filename):
         """Read a manifest file.
         """
-        mlist=list()
         mfile = open(filename, 'rb')
-        mlines = mfile.readlines()
+        mlist = mfile.read().split() #manifest entries contain no whitespace
         mfile.close()
-        for mline in mlines:
-            mline = mline.strip()
-            mlist.append(mline)
         return mlist
     
     
@@ -240,66 +236,61 @@ class AtomIndex(MASTObj):
                 list of atomic indices of matches, if find_multiple is true
                 Returns None if no match is found
         """
-        import glob
-        matchstring = "%s/atom_index_*" % self.sdir
-        idxnames = glob.glob(matchstring)
-        rtol=tol*100
-        coord_matches=list()
-        elem_matches=list()
-        scaling_matches=list()
-        for aname in idxnames:
-            if verbose > 0:
-                print aname
-            ameta=Metadata(metafile=aname)
-            aidx=ameta.read_data("atom_index")
-            amastfile = MASTFile(aname)
-            for aline in amastfile.data:
-                aline = aline.strip()
+        if include_orig == "only":
+            scaling_matches = self._find_orig_frac_coord_in_atom_table(coord,
+                    element, scaling_label, tol)
+        else:
+            import glob
+            matchstring = "%s/atom_index_*" % self.sdir
+            idxnames = glob.glob(matchstring)
+            rtol=tol*100
+            scaling_matches=list()
+            for aname in idxnames:
                 if verbose > 0:
-                    print aline
-                asplit = aline.split(" = ") # need spaces because of charge tags
-                if len(asplit) < 2: #no coordinates
-                    continue
-                alinekey = asplit[0].strip()
-                atom_ofc = asplit[1].strip()
-                if not "frac_coords" in alinekey:
+                    print aname
+                amastfile = MASTFile(aname)
+                afields = dict() #atom_index, element, scaling_label
+                coord_ok = False
+                for aline in amastfile.data:
                     if verbose > 0:
-                        print "skip line: not frac coords"
-                    continue
-                if alinekey == "original_frac_coords":
-                    if include_orig == "no":
-                        if verbose > 0:
-                            print "skip line: original frac coords"
+                        print aline.strip()
+                    #split before stripping so that an empty value,
+                    #e.g. "scaling_label = ", is kept as ""
+                    asplit = aline.split(" = ", 1) # need spaces because of charge tags
+                    if len(asplit) < 2: #no coordinates
                         continue
-                else:
-                    if include_orig == "only":
+                    alinekey = asplit[0].strip()
+                    atom_ofc = asplit[1].strip()
+                    if alinekey in ["atom_index","element","scaling_label"]:
+                        if not (alinekey in afields.keys()):
+                            afields[alinekey] = atom_ofc
+                        continue
+                    if coord_ok:
+                        continue
+                    if not "frac_coords" in alinekey:
                         if verbose > 0:
-                            print "skip line: not original frac coords"
+                            print "skip line: not frac coords"
                         continue
-                if ";" in atom_ofc:
-                    atom_ofc = atom_ofc.split(';')[-1].strip() # get most updated
-                atom_ofc_arr=np.array(atom_ofc[1:-1].split(),'float')
-                if verbose > 0:
-                    print atom_ofc_arr
-                #if np.allclose(atom_ofc_arr,coord,rtol,tol):
-                if len(find_in_coord_list_pbc([atom_ofc_arr],coord,tol)) > 0:
-                    coord_matches.append(aidx)
-                else:
+                    if alinekey == "original_frac_coords":
+                        if include_orig == "no":
+                            if verbose > 0:
+                                print "skip line: original frac coords"
+                            continue
+                    if ";" in atom_ofc:
+                        atom_ofc = atom_ofc.split(';')[-1].strip() # get most updated
+                    atom_ofc_arr=np.array(atom_ofc[1:-1].split(),'float')
                     if verbose > 0:
-                        print "no match for tol %3.3f; rejected" % tol
-        if element == "":
-            elem_matches = list(coord_matches)
-        else:
-            for aidx in coord_matches:
-                ameta=Metadata(metafile="%s/atom_index_%s" % (self.sdir, aidx))
-                atom_elem=ameta.read_data("element")
-                if (element == atom_elem):
-                    elem_matches.append(aidx)
-        for aidx in elem_matches:
-            ameta=Metadata(metafile="%s/atom_index_%s" % (self.sdir, aidx))
-            ascale=ameta.read_data("scaling_label")
-            if (scaling_label == ascale):
-                scaling_matches.append(aidx)
+                        print atom_ofc_arr
+                    #if np.allclose(atom_ofc_arr,coord,rtol,tol):
+                    if len(find_in_coord_list_pbc([atom_ofc_arr],coord,tol)) > 0:
+                        coord_ok = True
+                    else:
+                        if verbose > 0:
+                            print "no match for tol %3.3f; rejected" % tol
+                elem_ok = (element == "") or (element == afields.get("element"))
+                scale_ok = (scaling_label == afields.get("scaling_label"))
+                if coord_ok and elem_ok and scale_ok:
+                    scaling_matches.append(afields.get("atom_index"))
         allmatches = list(scaling_matches)
         allmatches = list(set(allmatches)) # get unique values
         if len(allmatches) == 0:
@@ -317,6 +308,144 @@ class AtomIndex(MASTObj):
                 return allmatches
         return None
 
+    def _load_atom_table(self):
+        """Load the original fractional coordinates, element, and
+            scaling label of every atom index into memory, so that
+            searches on original coordinates do not reopen every
+            atom index file.
+            The table is read from the structure index directory once;
+            atom indices written afterward by this object are added
+            through _add_to_atom_table.
+        """
+        if not (self._atom_table == None):
+            return
+        self._atom_table = dict()
+        if not os.path.isdir(self.sdir):
+            return
+        tablekeys = ["atom_index","original_frac_coords","element","scaling_label"]
+        for aname in os.listdir(self.sdir):
+            if not aname.startswith("atom_index_"):
+                continue
+            afile = open(os.path.join(self.sdir, aname), 'rb')
+            alines = afile.read().split("\n")
+            afile.close()
+            adict = dict()
+            for aline in alines: #one pass; first match wins, as in Metadata
+                asplit = aline.split(" = ")
+                if len(asplit) < 2:
+                    continue
+                akey = asplit[0].strip()
+                if (akey in tablekeys) and not (akey in adict.keys()):
+                    adict[akey] = asplit[1].strip()
+            if not ("original_frac_coords" in adict.keys()):
+                continue
+            atom_ofc = adict["original_frac_coords"]
+            if ";" in atom_ofc:
+                atom_ofc = atom_ofc.split(';')[-1].strip()
+            self._add_to_atom_table(adict.get("atom_index"),
+                    np.array(atom_ofc[1:-1].split(),'float'),
+                    adict.get("element"),
+                    adict.get("scaling_label"))
+        return
+
+    def _add_to_atom_table(self, akey, frac_coords, element, scaling_label):
+        """Add an atom index to the in-memory table, if the table
+            has been loaded.
+            Args:
+                akey <str>: atom index
+                frac_coords <numpy array of float>: original
+                    fractional coordinates
+                element <str>: element symbol
+                scaling_label <str>: scaling label
+        """
+        if self._atom_table == None:
+            return
+        if not scaling_label in self._atom_table.keys():
+            self._atom_table[scaling_label] = dict()
+            self._atom_table[scaling_label]['keys'] = list()
+            self._atom_table[scaling_label]['coords'] = list()
+            self._atom_table[scaling_label]['elements'] = list()
+        stable = self._atom_table[scaling_label]
+        stable['keys'].append(akey)
+        stable['coords'].append(np.array(frac_coords,'float'))
+        stable['elements'].append(element)
+        stable['coordarray'] = None #rebuilt on the next search
+        stable['querycache'] = dict() #new atom may match old queries
+        return
+
+    def _find_orig_frac_coord_in_atom_table(self, coord, element, scaling_label, tol):
+        """Find atom indices whose original fractional coordinates
+            match a FRACTIONAL coordinate, using the in-memory table.
+            Args:
+                coord <numpy array of float>: coordinate to find
+                element <str>: element symbol to match
+                                If blank, matches any element.
+                scaling_label <str>: scaling label
+                tol <float>: tolerance
+            Returns:
+                <list of str>: matching atom indices
+        """
+        matches=list()
+        for (akey, aelem) in self._find_orig_frac_coord_elements_in_atom_table(coord, scaling_label, tol):
+            if (element == "") or (element == aelem):
+                matches.append(akey)
+        return matches
+
+    def _find_orig_frac_coord_elements_in_atom_table(self, coord, scaling_label, tol):
+        """Find atom indices and elements whose original fractional
+            coordinates match a FRACTIONAL coordinate, using the
+            in-memory table.
+            Args:
+                coord <numpy array of float>: coordinate to find
+                scaling_label <str>: scaling label
+                tol <float>: tolerance
+            Returns:
+                <list of (str, str)>: matching (atom index, element) pairs
+            Results are cached per scaling label until an atom
+            index is added to that label.
+        """
+        self._load_atom_table()
+        if not scaling_label in self._atom_table.keys():
+            return list()
+        stable = self._atom_table[scaling_label]
+        qkey = (tuple(np.round(np.array(coord,'float'), 10)), tol)
+        if qkey in stable['querycache']:
+            return list(stable['querycache'][qkey])
+        if stable['coordarray'] is None:
+            stable['coordarray'] = np.array(stable['coords'],'float')
+        matches=list()
+        for cidx in find_in_coord_list_pbc(stable['coordarray'], coord, tol):
+            matches.append((stable['keys'][cidx], stable['elements'][cidx]))
+        stable['querycache'][qkey] = list(matches)
+        return matches
+
+    def _find_orig_frac_coords_within_radius(self, coord, scaling_label, radius):
+        """Find atom indices whose original fractional coordinates are
+            within a radius of a FRACTIONAL coordinate.
+            Distances are minimum-image distances in fractional
+            coordinates, so atoms across a periodic boundary are found.
+            Args:
+                coord <numpy array of float>: center coordinate
+                scaling_label <str>: scaling label
+                radius <float>: radius, in fractional coordinates
+            Returns:
+                <list of str>: sorted list of matching atom indices
+        """
+        self._load_atom_table()
+        if not scaling_label in self._atom_table.keys():
+            return list()
+        stable = self._atom_table[scaling_label]
+        if stable['coordarray'] is None:
+            stable['coordarray'] = np.array(stable['coords'],'float')
+        fdist = stable['coordarray'] - np.array(coord,'float')
+        fdist -= np.round(fdist)
+        inradius = np.sum(fdist * fdist, axis=1) <= radius * radius
+        matches=list()
+        for cidx in np.nonzero(inradius)[0]:
+            matches.append(stable['keys'][cidx])
+        matches.sort()
+        return matches
+
     def write_defected_phonon_sd_manifests(self):
         """Write defected phonon structure dynamics manifests.
         """
@@ -325,13 +454,11 @@ class AtomIndex(MASTObj):
             return None
         dlabels=defect_dict.keys()
         
-        scales = self.scaling.keys()
-        scales.append("")
-        for scaling_label in scales:
+        for scaling_label in self.scales:
             if scaling_label == "":
-                mySE=SE(struc_work1=self.startstr.copy())
+                mySE=SE(struc_work1=self.startstr)
             else:
-                mySE=SE(struc_work1=self.startstr.copy(), scaling_size=self.scaling[scaling_label]["mast_size"])
+                mySE=SE(struc_work1=self.startstr, scaling_size=self.scaling[scaling_label]["mast_size"])
             for dlabel in dlabels:
                 pdict=dict(defect_dict[dlabel]["phonon"])
                 for phonon_label in pdict.keys():
@@ -342,12 +469,10 @@ class AtomIndex(MASTObj):
                     if not (scaling_label == ""):
                         pcoords = mySE.get_scaled_coordinates(pcoords)
                      
-                    pindices = self.find_frac_coord_in_atom_indices(pcoords,
-                            include_orig="only",
-                            element="",
-                            scaling_label=scaling_label,
-                            find_multiple=True,
-                            tol=0.0001+pcrad)
+                    pindices = self._find_orig_frac_coords_within_radius(pcoords,
+                            scaling_label, 0.0001+pcrad)
+                    if len(pindices) == 0:
+                        raise MASTError(self.__class__.__name__, "No atoms found within %s of phonon center %s for defect %s, phonon %s, scaling %s" % (pcrad, pcoords, dlabel, phonon_label, scaling_label))
                     manname=os.path.join(self.sdir,"manifest_phonon_sd_%s_%s_%s" % (dlabel, phonon_label, scaling_label))
                     self.write_manifest_file(pindices, manname) 
         return 
@@ -360,13 +485,11 @@ class AtomIndex(MASTObj):
             return None
         nlabels=neb_dict.keys()
         
-        scales = self.scaling.keys()
-        scales.append("")
-        for scaling_label in scales:
+        for scaling_label in self.scales:
             if scaling_label == "":
-                mySE=SE(struc_work1=self.startstr.copy())
+                mySE=SE(struc_work1=self.startstr)
             else:
-                mySE=SE(struc_work1=self.startstr.copy(), scaling_size=self.scaling[scaling_label]["mast_size"])
+                mySE=SE(struc_work1=self.startstr, scaling_size=self.scaling[scaling_label]["mast_size"])
             for nlabel in nlabels:
                 def1 = nlabel.split("-")[0].strip()
                 def2 = nlabel.split("-")[1].strip()
@@ -374,18 +497,12 @@ class AtomIndex(MASTObj):
                 manname2=os.path.join(self.sdir,"manifest_%s_%s_%s" % (scaling_label, def2, nlabel))
                 mlist1raw=list(self.read_manifest_file("%s/manifest_%s_%s_" % (self.sdir, scaling_label, def1)))
                 mlist2raw=list(self.read_manifest_file("%s/manifest_%s_%s_" % (self.sdir, scaling_label, def2)))
-                mlist1=list()
-                mlist2=list()
+                mlist1=OrderedDict() #ordered sets
+                mlist2=OrderedDict()
                 for mitem in mlist1raw: #clean up leftover semicolons from defect manifests
-                    if ";" in mitem:
-                        mlist1.append(mitem.split(";")[0])
-                    else:
-                        mlist1.append(mitem)
+                    mlist1[mitem.split(";")[0]] = None
                 for mitem in mlist2raw: #clean up leftover semicolons from defect manifests
-                    if ";" in mitem:
-                        mlist2.append(mitem.split(";")[0])
-                    else:
-                        mlist2.append(mitem)
+                    mlist2[mitem.split(";")[0]] = None
                 maddtoend1=list()
                 maddtoend2=list()
                 nlines=list(neb_dict[nlabel]["lines"])
@@ -405,15 +522,17 @@ class AtomIndex(MASTObj):
                         element=nelem, scaling_label=scaling_label, 
                         find_multiple=False, tol=0.001)
                     try:
-                        mlist1.remove(nidx1)
-                    except ValueError:
-                        raise MASTError(self.__class__.__name__, "For neb %s, cannot remove atom index %s from mlist1: %s" % (nlabel, nidx1, mlist1))
+                        del mlist1[nidx1]
+                    except KeyError:
+                        raise MASTError(self.__class__.__name__, "For neb %s, cannot remove atom index %s from mlist1: %s" % (nlabel, nidx1, list(mlist1)))
                     maddtoend1.append(nidx1) #resort matches to the bottom
                     try:
-                        mlist2.remove(nidx2)
-                    except ValueError:
-                        raise MASTError(self.__class__.__name__, "For neb %s, cannot remove atom index %s from mlist2: %s" % (nlabel, nidx2, mlist2))
+                        del mlist2[nidx2]
+                    except KeyError:
+                        raise MASTError(self.__class__.__name__, "For neb %s, cannot remove atom index %s from mlist2: %s" % (nlabel, nidx2, list(mlist2)))
                     maddtoend2.append(nidx2)
+                mlist1 = list(mlist1)
+                mlist2 = list(mlist2)
                 if not (mlist1==mlist2):
                     raise MASTError("NEB %s truncated manifests do not match: %s, %s" % (nlabel, mlist1, mlist2))
                 mlist1.extend(maddtoend1)
@@ -429,13 +548,11 @@ class AtomIndex(MASTObj):
             return None
         nlabels=neb_dict.keys()
         
-        scales = self.scaling.keys()
-        scales.append("")
-        for scaling_label in scales:
+        for scaling_label in self.scales:
             if scaling_label == "":
-                mySE=SE(struc_work1=self.startstr.copy())
+                mySE=SE(struc_work1=self.startstr)
             else:
-                mySE=SE(struc_work1=self.startstr.copy(), scaling_size=self.scaling[scaling_label]["mast_size"])
+                mySE=SE(struc_work1=self.startstr, scaling_size=self.scaling[scaling_label]["mast_size"])
             for nlabel in nlabels:
                 pdict = dict(neb_dict[nlabel]["phonon"])
                 for phonon_label in pdict.keys():
@@ -446,12 +563,10 @@ class AtomIndex(MASTObj):
                     if not (scaling_label == ""):
                         pcoords = mySE.get_scaled_coordinates(pcoords)
                      
-                    pindices = self.find_frac_coord_in_atom_indices(pcoords,
-                        include_orig="only",
-                        element="",
-                        scaling_label=scaling_label,
-                        find_multiple=True,
-                        tol=0.0001+pcrad)
+                    pindices = self._find_orig_frac_coords_within_radius(pcoords,
+                        scaling_label, 0.0001+pcrad)
+                    if len(pindices) == 0:
+                        raise MASTError(self.__class__.__name__, "No atoms found within %s of phonon center %s for neb %s, phonon %s, scaling %s" % (pcrad, pcoords, nlabel, phonon_label, scaling_label))
                     manname=os.path.join(self.sdir,"manifest_phonon_sd_%s_%s_%s" % (nlabel, phonon_label, scaling_label))
                     self.write_manifest_file(pindices, manname) 
         return
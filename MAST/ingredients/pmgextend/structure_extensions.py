@@ -34,6 +34,7 @@ class StructureExtensions(MASTObj):
         self.logger = loggerutils.get_mast_logger(rname)
         self.metafile = Metadata(metafile='%s/metadata.txt' % self.keywords['name'])
         self.scaleinput=""
+        self.scaleinverse=None
         self.transform_scaling_size()
         return
 
@@ -69,6 +70,7 @@ class StructureExtensions(MASTObj):
         
         newarr = np.array([rows_int[0],rows_int[1],rows_int[2]])
         self.scaleinput = newarr
+        self.scaleinverse = np.linalg.inv(newarr) #reused for every scaled coordinate
         return
 
     def induce_defect(self, defect, coord_type, threshold):
@@ -157,24 +159,24 @@ class StructureExtensions(MASTObj):
         struct_ed = sortedstruc.copy()
         nebidx = list()
         elemstarts = self._get_element_indices(sortedstruc)
+        scalingsize = self.metafile.read_data('scaling_size')
         for nebline in neblines:
             nebdict = self._parse_neb_line(nebline)
-            temp_fin = sortedstruc.copy()
-            temp_fin.append(nebdict['element'],nebdict['coord'][1])
             temp_start = sortedstruc.copy()
             temp_start.append(nebdict['element'],nebdict['coord'][0])
-            strlist=temp_start.interpolate(temp_fin, images+1)
-            lastidx = strlist[0].num_sites-1
+            lastidx = temp_start.num_sites-1
             if folderstr == '00':
                 mycoord = nebdict['coord'][0]
             elif folderstr == str(images+1).zfill(2):
                 mycoord = nebdict['coord'][1]
-            else:
+            else: #only intermediate images need the interpolation
+                temp_fin = sortedstruc.copy()
+                temp_fin.append(nebdict['element'],nebdict['coord'][1])
+                strlist=temp_start.interpolate(temp_fin, images+1)
                 mystridx = int(folderstr)
                 mycoord = strlist[mystridx].frac_coords[lastidx]
-            scalingsize = self.metafile.read_data('scaling_size')
             if not (scalingsize == None):
-                mycoord = np.dot(mycoord, np.linalg.inv(self.scaleinput))
+                mycoord = np.dot(mycoord, self.scaleinverse)
                 #scale = scalingsize.split('[')[1].split(']')[0]
                 #try:
                 #    scaleinput = [int(scale.split(',')[0]),int(scale.split(',')[1]),int(scale.split(',')[2])] # input scaling size like [2,1,2]
@@ -293,7 +295,7 @@ class StructureExtensions(MASTObj):
         pcscoord = np.array(phonon_center_site.strip().split(), float)
         scalingsize = self.metafile.read_data('scaling_size')
         if not (scalingsize == None):
-            pcscoord = np.dot(pcscoord, np.linalg.inv(self.scaleinput))
+            pcscoord = np.dot(pcscoord, self.scaleinverse)
             #scale = scalingsize.split('[')[1].split(']')[0]
             #try:
             #    scaleinput = [int(scale.split(',')[0]),int(scale.split(',')[1]),int(scale.split(',')[2])] # input scaling size like [2,1,2]
@@ -441,7 +443,7 @@ class StructureExtensions(MASTObj):
                 defected structure <Structure>
         """
         mycoords = np.array(defect['coordinates'])
-        [coorda,coordb,coordc] = np.dot(mycoords, np.linalg.inv(self.scaleinput))
+        [coorda,coordb,coordc] = np.dot(mycoords, self.scaleinverse)
         #scale = self.keywords['scaling_size']
         #scale = scale.strip()
         #if len(scale.split(',')) == 3:
@@ -469,7 +471,7 @@ class StructureExtensions(MASTObj):
             Returns:
                 newcoords <numpy array of float>: new coordinates
         """
-        [coorda,coordb,coordc] = np.dot(mycoords, np.linalg.inv(self.scaleinput))
+        [coorda,coordb,coordc] = np.dot(mycoords, self.scaleinverse)
         #scale = self.keywords['scaling_size']
         #scale = scale.strip()
         #if len(scale.split(',')) == 3:
@@ -731,24 +731,23 @@ class InputParser(MASTObj):
             eldict = input_options.get_item('structure','element_map')
         if len(eldict) == 0:
             return
+        #element_map keys are already upper case (see parse_structure_section);
+        #use dict membership rather than building a keys() list per lookup
         if 'defects' in input_options.get_sections():
             defdict = input_options.get_item('defects','defects')
-            for dkey in defdict.keys():
-                for sdkey in defdict[dkey].keys():
+            for ddict in defdict.itervalues():
+                for sdkey, sddict in ddict.iteritems():
                     if 'subdefect' in sdkey:
-                        symbol = defdict[dkey][sdkey]['symbol'].upper()
-                        if symbol in eldict.keys():
-                            defdict[dkey][sdkey]['symbol'] = eldict[symbol]
+                        mapped = eldict.get(sddict['symbol'].upper())
+                        if not (mapped == None):
+                            sddict['symbol'] = mapped
         if 'neb' in input_options.get_sections():
             nebdict = input_options.get_item('neb','nebs')
-            for nebkey in nebdict.keys():
-                nlinenum = len(nebdict[nebkey]['lines'])
-                nlinect=0
-                while nlinect < nlinenum:
-                    symbol = nebdict[nebkey]['lines'][nlinect][0].upper()
-                    if symbol in eldict.keys():
-                        nebdict[nebkey]['lines'][nlinect][0] = eldict[symbol]
-                    nlinect = nlinect + 1
+            for ndict in nebdict.itervalues():
+                for nline in ndict['lines']:
+                    mapped = eldict.get(nline[0].upper())
+                    if not (mapped == None):
+                        nline[0] = mapped
         return
 
 
@@ -758,14 +757,8 @@ class InputParser(MASTObj):
             Args:
                 input_options <InputOptions>
         """
-        have_exec = False
-        for ingredient, options in input_options.get_item('ingredients').items():
-            if 'mast_exec' in options:
-                have_exec = True
-                break
-            else:
-                have_exec = False
-
+        have_exec = any('mast_exec' in options
+                for options in input_options.get_item('ingredients').itervalues())
         if (not have_exec):
             error = 'mast_exec keyword not found in the $ingredients section'
             raise MASTError(self.__class__.__name__, error)
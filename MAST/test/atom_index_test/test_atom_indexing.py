@@ -147,7 +147,29 @@ class TestAtomIndexing(unittest.TestCase):
         self.assertItemsEqual(findtest4, ["0000000000000x12","0000000000000xTOL"])
         print "subtest4 ok"
         return
-    
+
+    def test_find_orig_frac_coords_within_radius(self):
+        #raise SkipTest
+        wdir=self.wdir
+        os.environ['MAST_SCRATCH']=wdir
+        myipparser=InputParser(inputfile=os.path.join(testdir,"neb_pathfinder.inp"))
+        myio = myipparser.parse()
+        test_sid = os.path.join(testdir, "find_coord_files")
+        myai = AtomIndex(input_options=myio, structure_index_directory=test_sid)
+        #center is across the periodic boundary from the x=0 atoms
+        center=np.array([0.999,0.0,0.5],'float')
+        findtest1 = myai._find_orig_frac_coords_within_radius(center, "", 0.0015)
+        self.assertEqual(findtest1, ["0000000000000x12","0000000000000xE2"])
+        print "subtest1 ok"
+        findtest2 = myai._find_orig_frac_coords_within_radius(center, "", 0.004)
+        self.assertEqual(findtest2, ["0000000000000x12","0000000000000xE2",
+                "0000000000000xTOL"])
+        print "subtest2 ok"
+        findtest3 = myai._find_orig_frac_coords_within_radius(center, "nolabel", 0.004)
+        self.assertEqual(findtest3, list())
+        print "subtest3 ok"
+        return
+
     def test_find_frac_coord_in_atom_indices(self):
         #raise SkipTest
         wdir=self.wdir
@@ -176,6 +198,25 @@ class TestAtomIndexing(unittest.TestCase):
         self.assertItemsEqual(findtest4, ["0000000000000x12","0000000000000xTOL"])
         print "subtest4 ok"
         return
+    def test_find_frac_coord_in_atom_indices_unscaled(self):
+        #raise SkipTest
+        wdir=self.wdir
+        os.environ['MAST_SCRATCH']=wdir
+        myipparser=InputParser(inputfile=os.path.join(testdir,"neb_pathfinder.inp"))
+        myio = myipparser.parse()
+        test_sid = os.path.join(testdir, "find_coord_files")
+        myai = AtomIndex(input_options=myio, structure_index_directory=test_sid)
+        #atom_index_00000000000000x2 has an empty "scaling_label = " line
+        orig_coord=np.array([0.0,0.0,0.0],'float')
+        findtest1 = myai.find_frac_coord_in_atom_indices(orig_coord,
+                include_orig="yes", element="Al", scaling_label="")
+        self.assertEqual(findtest1, "00000000000000x2")
+        print "subtest1 ok"
+        findtest2 = myai.find_frac_coord_in_atom_indices(orig_coord,
+                include_orig="no", element="Al", scaling_label="")
+        self.assertEqual(findtest2, "00000000000000x2")
+        print "subtest2 ok"
+        return
     def test_write_defected_phonon_sd_manifests(self):
         #raise SkipTest
         tdir=os.path.join(testdir,'manifest_files')
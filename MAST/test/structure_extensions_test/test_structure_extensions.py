@@ -23,16 +23,32 @@ testdir = dirutil.get_test_dir(testname)
 class TestSE(unittest.TestCase):
     """Test StructureExtensions
     """
+    _structure_cache = dict()
+
+    def get_structure(self, poscarname):
+        """Parse a test POSCAR once and return a copy of its structure."""
+        if not poscarname in self._structure_cache.keys():
+            self._structure_cache[poscarname] = Poscar.from_file(os.path.join(testdir, poscarname)).structure
+        return self._structure_cache[poscarname].copy()
+
+    def assertStructureEqual(self, struc1, struc2):
+        """Compare species and fractional coordinates, in site order,
+            as whole arrays. Run before the full Structure comparison
+            so that a mismatch fails without the site-by-site loop.
+        """
+        self.assertEqual(struc1.species, struc2.species)
+        np.testing.assert_allclose(struc1.frac_coords, struc2.frac_coords, atol=1e-6)
+
     def setUp(self):
         os.chdir(testdir)
 
     def tearDown(self):
         pass
     def test_induce_defect_frac(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
-        compare_vac1 = Poscar.from_file("POSCAR_vac1").structure
-        compare_int1 = Poscar.from_file("POSCAR_int1").structure
-        compare_sub1 = Poscar.from_file("POSCAR_sub1").structure
+        perfect = self.get_structure("POSCAR_perfect")
+        compare_vac1 = self.get_structure("POSCAR_vac1")
+        compare_int1 = self.get_structure("POSCAR_int1")
+        compare_sub1 = self.get_structure("POSCAR_sub1")
         coord_type='fractional'
         threshold=1.e-4
         vac1={'symbol':'O', 'type': 'vacancy', 'coordinates':  np.array([0.25, 0.75, 0.25])}
@@ -42,6 +58,9 @@ class TestSE(unittest.TestCase):
         struc_vac1 = sxtend.induce_defect(vac1, coord_type, threshold)
         struc_int1 = sxtend.induce_defect(int1, coord_type, threshold)
         struc_sub1 = sxtend.induce_defect(sub1, coord_type, threshold)
+        self.assertStructureEqual(struc_vac1,compare_vac1)
+        self.assertStructureEqual(struc_int1,compare_int1)
+        self.assertStructureEqual(struc_sub1,compare_sub1)
         self.assertEqual(struc_vac1,compare_vac1)
         self.assertEqual(struc_int1,compare_int1)
         self.assertEqual(struc_sub1,compare_sub1)
@@ -53,10 +72,10 @@ class TestSE(unittest.TestCase):
         self.assertEqual(struc_sub1.sites,compare_sub1.sites)
     
     def test_sort_structure_and_neb_lines(self):
-        perfect1 = Poscar.from_file("POSCAR_defectgroup1").structure
-        compare_sorted1 = Poscar.from_file("POSCAR_sorted1").structure
-        perfect2 = Poscar.from_file("POSCAR_defectgroup2").structure
-        compare_sorted2 = Poscar.from_file("POSCAR_sorted2").structure
+        perfect1 = self.get_structure("POSCAR_defectgroup1")
+        compare_sorted1 = self.get_structure("POSCAR_sorted1")
+        perfect2 = self.get_structure("POSCAR_defectgroup2")
+        compare_sorted2 = self.get_structure("POSCAR_sorted2")
         neblines = list()
         neblines.append(["Cr","0.3 0 0","0 0 0"])
         neblines.append(["Ni","0.6 0 0","0.3 0 0"])
@@ -88,9 +107,9 @@ class TestSE(unittest.TestCase):
         neblines.append(["Cr","0.4 0.2 0.1","0.3 0.3 0.2"])
         neblines.append(["Cr","0.29 0.05 0.05","0.01 0.01 0.98"])
         neblines.append(["Ni","0.61 0.99 0.98","0.25 0.01 0.97"])
-        perfect3 = Poscar.from_file("POSCAR_defectgroup3").structure
+        perfect3 = self.get_structure("POSCAR_defectgroup3")
         #print perfect3.get_sorted_structure()
-        perfect4 = Poscar.from_file("POSCAR_defectgroup4").structure
+        perfect4 = self.get_structure("POSCAR_defectgroup4")
         #print perfect4.get_sorted_structure()
         sxtend3 = StructureExtensions(struc_work1=perfect3, name=testdir)
         sorted3 = sxtend3.sort_structure_and_neb_lines(neblines,"00",3)
@@ -98,9 +117,9 @@ class TestSE(unittest.TestCase):
         sxtend4 = StructureExtensions(struc_work1=perfect4, name=testdir)
         sorted4 = sxtend4.sort_structure_and_neb_lines(neblines,"04",3)
         #print sorted4
-        compare_sorted3 = Poscar.from_file("POSCAR_sorted3").structure
+        compare_sorted3 = self.get_structure("POSCAR_sorted3")
         #print compare_sorted3
-        compare_sorted4 = Poscar.from_file("POSCAR_sorted4").structure
+        compare_sorted4 = self.get_structure("POSCAR_sorted4")
         #print compare_sorted4
         self.assertEqual(sorted3, compare_sorted3)
         self.assertEqual(sorted4, compare_sorted4)
@@ -116,32 +135,32 @@ class TestSE(unittest.TestCase):
         neblines.append(["Cr","0.4 0.2 0.1","0.3 0.3 0.2"])
         neblines.append(["Cr","0.29 0.05 0.05","0.01 0.01 0.98"])
         neblines.append(["Ni","0.61 0.99 0.98","0.25 0.01 0.97"])
-        perfect3 = Poscar.from_file("POSCAR_defectgroup3_scrambled").structure
+        perfect3 = self.get_structure("POSCAR_defectgroup3_scrambled")
         #print perfect3.get_sorted_structure()
         #print perfect4.get_sorted_structure()
         sxtend3 = StructureExtensions(struc_work1=perfect3)
         sorted3 = sxtend3.sort_structure_and_neb_lines(neblines,"00",3)
-        compare_sorted3 = Poscar.from_file("POSCAR_sorted3").structure
+        compare_sorted3 = self.get_structure("POSCAR_sorted3")
         self.assertEqual(sorted3, compare_sorted3)
         self.assertEqual(sorted3.lattice, compare_sorted3.lattice)
         self.assertEqual(sorted3.sites, compare_sorted3.sites)
-        perfect3 = Poscar.from_file("POSCAR_defectgroup3_really_scrambled").structure
+        perfect3 = self.get_structure("POSCAR_defectgroup3_really_scrambled")
         #print perfect3.get_sorted_structure()
         #print perfect4.get_sorted_structure()
         sxtend3 = StructureExtensions(struc_work1=perfect3)
         sorted3 = sxtend3.sort_structure_and_neb_lines(neblines,"00",3)
-        compare_sorted3 = Poscar.from_file("POSCAR_sorted3").structure
+        compare_sorted3 = self.get_structure("POSCAR_sorted3")
         self.assertEqual(sorted3, compare_sorted3)
         self.assertEqual(sorted3.lattice, compare_sorted3.lattice)
         self.assertEqual(sorted3.sites, compare_sorted3.sites)
 
 
     def test_interpolation(self):
-        ep1 = Poscar.from_file("POSCAR_ep1").structure
-        ep2 = Poscar.from_file("POSCAR_ep2").structure
-        compare_im1 = Poscar.from_file("POSCAR_im1").structure
-        compare_im2 = Poscar.from_file("POSCAR_im2").structure
-        compare_im3 = Poscar.from_file("POSCAR_im3").structure
+        ep1 = self.get_structure("POSCAR_ep1")
+        ep2 = self.get_structure("POSCAR_ep2")
+        compare_im1 = self.get_structure("POSCAR_im1")
+        compare_im2 = self.get_structure("POSCAR_im2")
+        compare_im3 = self.get_structure("POSCAR_im3")
         sxtend = StructureExtensions(struc_work1 = ep1, struc_work2 = ep2)
         slist = sxtend.do_interpolation(3)
         self.assertEqual(slist[0],ep1)
@@ -150,7 +169,7 @@ class TestSE(unittest.TestCase):
         self.assertEqual(slist[3],compare_im3)
         self.assertEqual(slist[4],ep2)
     def test_get_sd_array(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
+        perfect = self.get_structure("POSCAR_perfect")
         sxtend = StructureExtensions(struc_work1=perfect, name=testdir)
         mysd = sxtend.get_sd_array("0.5 0.5 0.5", 3)
         #print mysd
@@ -161,7 +180,7 @@ class TestSE(unittest.TestCase):
             myarr[idx-1][2]=True
         self.assertEqual(sum(np.fabs(sum(mysd-myarr))),0)
     def test_get_sd_array_periodic_boundary(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
+        perfect = self.get_structure("POSCAR_perfect")
         sxtend = StructureExtensions(struc_work1=perfect, name=testdir)
         mysd = sxtend.get_sd_array("0.95 0.95 0.95", 1, 0.07)
         #print mysd
@@ -172,7 +191,7 @@ class TestSE(unittest.TestCase):
             myarr[idx-1][2]=True
         self.assertEqual(sum(np.fabs(sum(mysd-myarr))),0)
     def test_multiple_sd_array(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
+        perfect = self.get_structure("POSCAR_perfect")
         sxtend = StructureExtensions(struc_work1=perfect, name=testdir)
         mysdlist = sxtend.get_multiple_sd_array("0.5 0.5 0.5", 1)
         mylist=list()
@@ -186,9 +205,9 @@ class TestSE(unittest.TestCase):
         self.assertEqual(sum(np.fabs(sum(mysdlist[1]-mylist[1]))),0)
         self.assertEqual(sum(np.fabs(sum(mysdlist[2]-mylist[2]))),0)
     def test_graft_coordinates(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
-        coordsonly = Poscar.from_file("POSCAR_coordinates").structure
-        compare_grafted = Poscar.from_file("POSCAR_grafted").structure
+        perfect = self.get_structure("POSCAR_perfect")
+        coordsonly = self.get_structure("POSCAR_coordinates")
+        compare_grafted = self.get_structure("POSCAR_grafted")
         sxtend = StructureExtensions(struc_work1=perfect)
         grafted = sxtend.graft_coordinates_onto_structure(coordsonly)
         self.assertEqual(grafted, compare_grafted)
@@ -196,35 +215,35 @@ class TestSE(unittest.TestCase):
         self.assertEqual(grafted.sites, compare_grafted.sites)
 
     def test_strain_lattice(self):
-        perfect = Poscar.from_file("POSCAR_unstrained").structure
+        perfect = self.get_structure("POSCAR_unstrained")
         sxtend = StructureExtensions(struc_work1=perfect)
         strained = sxtend.strain_lattice(" 0.98 0.92 1.03  \n")
-        strain_compare = Poscar.from_file("POSCAR_strained").structure
+        strain_compare = self.get_structure("POSCAR_strained")
         self.assertEqual(strained, strain_compare)
         self.assertEqual(strained.lattice, strain_compare.lattice)
         self.assertEqual(strained.sites, strain_compare.sites)
     def test_scale_structure_three(self):
-        hcp = Poscar.from_file("POSCAR_HCP").structure
+        hcp = self.get_structure("POSCAR_HCP")
         sxtend = StructureExtensions(struc_work1=hcp, scaling_size="2,2,2", name=testdir)
         scaled = sxtend.scale_structure()
-        compare = Poscar.from_file("POSCAR_HCP_222").structure
+        compare = self.get_structure("POSCAR_HCP_222")
         #self.assertEqual(scaled, Poscar.from_file("POSCAR_HCP_222").structure)
         self.assertAlmostEqual(scaled.volume, compare.volume, places=4)
         self.assertEqual(scaled.lattice, compare.lattice)
         self.assertEqual(scaled.sites.sort(), compare.sites.sort())
         return
     def test_scale_structure_nine(self):
-        hcp = Poscar.from_file("POSCAR_HCP").structure
+        hcp = self.get_structure("POSCAR_HCP")
         sxtend = StructureExtensions(struc_work1=hcp, scaling_size="2 0 0,0 2 0,0 0 2", name=testdir)
         scaled = sxtend.scale_structure()
-        compare = Poscar.from_file("POSCAR_HCP_222").structure
+        compare = self.get_structure("POSCAR_HCP_222")
         #self.assertEqual(scaled, Poscar.from_file("POSCAR_HCP_222").structure)
         self.assertAlmostEqual(scaled.volume, compare.volume, places=4)
         self.assertEqual(scaled.lattice, compare.lattice)
         self.assertEqual(scaled.sites.sort(), compare.sites.sort())
         return
     def test_scale_defect(self):
-        perfect = Poscar.from_file("POSCAR_perfect").structure
+        perfect = self.get_structure("POSCAR_perfect")
         scalingsize = "2,2,2"
         sxtend = StructureExtensions(struc_work1=perfect, scaling_size=scalingsize, name=testdir)
         scaled = sxtend.scale_structure()
@@ -237,4 +256,4 @@ class TestSE(unittest.TestCase):
         sub1={'symbol':'Fe', 'type': 'substitution','coordinates':np.array([0.25, 0.25,0.75])}
         sxtend4 = StructureExtensions(struc_work1=defected2, struc_work2=perfect, scaling_size=scalingsize, name=testdir)
         defected3 = sxtend4.scale_defect(sub1,'fractional',0.0001)
-        self.assertEqual(Poscar.from_file("POSCAR_scaled_defected").structure, defected3)
+        self.assertEqual(self.get_structure("POSCAR_scaled_defected"), defected3)
@@ -113,10 +113,7 @@ class ParsingInputFiles(object):
                 lattice <str>: specific name of the POSCAR given by the user
         """
         data={'a':0,'c':0,'No.':0}
-        os.system('cp '+latt+'_POSCAR POSCAR')
-
-        struct = Poscar.from_file('POSCAR').structure
-        os.system('rm POSCAR')
+        struct = Poscar.from_file(latt+'_POSCAR').structure
         reduced = SpacegroupAnalyzer(struct,0.001).get_primitive_standard_structure()   
         data['No.'] = len(struct)
         if model==5:
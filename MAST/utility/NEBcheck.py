@@ -85,7 +85,7 @@ def add_defects():
         rp.append('phonon int '+str(mid[0])+' '+str(mid[1])+' '+str(mid[2])+' 0.0\n')
         rp.append('end\n')
     rp.append('$end\n')
-    os.system('rm temp.inp')  
+    os.remove('temp.inp')
     fp.writelines(rp)
     return name
 
@@ -6,10 +6,19 @@
 ##############################################################
 import os
 import sys
+import errno
 import fnmatch
+import re
 import time
 from MAST.utility import MASTError
 from MAST.utility.metadata import Metadata
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
 
 def immediate_subdirs(existdir, verbose=0):
     """Walk through directory and return immediate subdirectories
@@ -22,50 +31,92 @@ def immediate_subdirs(existdir, verbose=0):
     """
     if not (os.path.exists(existdir)):
         raise MASTError("utility","No directory at " +existdir)
-    listdir = os.listdir(existdir)
     subdirs=list()
-    for myentry in listdir:
-        trydir = os.path.join(existdir, myentry)
-        if os.path.isdir(trydir):
-            subdirs.append(myentry)
+    if scandir is None:
+        for myentry in os.listdir(existdir):
+            trydir = os.path.join(existdir, myentry)
+            if os.path.isdir(trydir):
+                subdirs.append(myentry)
+    else:
+        #scandir entries carry the file type from the directory listing,
+        #so no extra stat is needed per entry
+        for myentry in scandir(existdir):
+            if myentry.is_dir():
+                subdirs.append(myentry.name)
     subdirs.sort()
     if verbose == 1:
         print "subdirectories:", subdirs
     return subdirs
 
 
+def _split_dir_entries(dirpath):
+    """Split a directory listing into subdirectories and files.
+        Symlinks to directories are omitted from both lists, as in
+        the old os.walk-based walkdirs and walkfiles.
+        Args:
+            dirpath <str>: directory to list
+        Returns:
+            <list of str>: subdirectory names to descend into
+            <list of str>: names of entries that are not directories
+    """
+    subdirs=list()
+    files=list()
+    if scandir is None:
+        for myentry in os.listdir(dirpath):
+            trypath = os.path.join(dirpath, myentry)
+            if os.path.isdir(trypath):
+                if not os.path.islink(trypath):
+                    subdirs.append(myentry)
+            else:
+                files.append(myentry)
+    else:
+        for myentry in scandir(dirpath):
+            if myentry.is_dir():
+                if not myentry.is_symlink():
+                    subdirs.append(myentry.name)
+            else:
+                files.append(myentry.name)
+    return subdirs, files
+
+def _walk_to_depth(dirpath, maxdepth, depth=0):
+    """Walk a directory tree like os.walk, but stop descending
+        once maxdepth levels below the top are reached.
+        Args:
+            dirpath <str>: directory to walk
+            maxdepth <int>: deepest level to list
+            depth <int>: level of dirpath (0 for the top)
+        Yields:
+            (dirpath, depth, subdirs, files) for each listed directory
+    """
+    try:
+        subdirs, files = _split_dir_entries(dirpath)
+    except OSError: #unreadable directory; os.walk skips these too
+        return
+    yield (dirpath, depth, subdirs, files)
+    if depth < maxdepth:
+        for subdir in subdirs:
+            for walkentry in _walk_to_depth(os.path.join(dirpath, subdir), maxdepth, depth+1):
+                yield walkentry
+
 def walkdirs(existdir, mindepth=1, maxdepth=5, matchme=""):
     """Walk through directory and return list of subdirectories."""
     if not(os.path.exists(existdir)):
         raise MASTError("utility","No directory at " +existdir)
-#   walk and make main list
-    walkme=""
-    walkentry=""
-    walkme = os.walk(existdir)
-    if walkme == ():
-        raise MASTError("utility walkdirs","No folders found in " + existdir)
-    bigdirlist=[]
-    for walkentry in walkme:
-        bigdirlist.append(walkentry[0])
-#   sort list and pare down according to min/max depth
-    numsep=0
-    minnumsep=0
-    maxnumsep=0
-    numsep = existdir.count('/') # find base number of forward slashes
-    minnumsep = numsep + mindepth
-    maxnumsep = numsep + maxdepth
-    onedir=""
-    onenumsep=0
+    #directories at maxdepth come from their parents' listings,
+    #so only list down to maxdepth-1
     smalldirlist=[]
-    for onedir in bigdirlist:
-        onenumsep = onedir.count('/')
-        if (onenumsep >= minnumsep) and (onenumsep <= maxnumsep):
+    for (onedir, depth, subdirs, files) in _walk_to_depth(existdir, maxdepth-1):
+        if (depth >= mindepth) and (depth <= maxdepth):
             smalldirlist.append(onedir)
+        if (depth+1 == maxdepth) and (depth+1 >= mindepth):
+            for subdir in subdirs:
+                smalldirlist.append(os.path.join(onedir, subdir))
     smalldirlist.sort()
     if not matchme == "":
+        matchre = re.compile(fnmatch.translate(matchme))
         matchdirlist=[]
         for mydir in smalldirlist:
-            if fnmatch.fnmatch(mydir, matchme):
+            if matchre.match(mydir):
                 matchdirlist.append(mydir)
         return matchdirlist
     else:
@@ -86,52 +137,32 @@ def walkfiles(existdir, mindepth=1, maxdepth=5, matchme=""):
     """
     if not(os.path.exists(existdir)):
         raise MASTError("utility","No directory at " +existdir)
-#   walk and make main list
-    walkme=""
-    walkme = os.walk(existdir)
-    if walkme == ():
-        raise MASTError("utility walkfiles","No folders found in " + existdir)
-    filetree=""
-    diritem=""
-    fileitem=""
-    fullfile=""
-    filelist=[]
-    filetree = os.walk(existdir)
-    for diritem in filetree:
-        for fileitem in diritem[2]:
-            fullfile = diritem[0] + '/' + fileitem
-            filelist.append(fullfile)
-    #for fullfile in filelist:
-    #    print fullfile
-#   #   sort and pare file list
+    #files directly in existdir are at depth 1
     paredfilelist=[]
-    numsep=0
-    minnumsep=0
-    maxnumsep=0
-    numsep = existdir.count('/') # find base number of forward slashes
-    minnumsep = numsep + mindepth
-    maxnumsep = numsep + maxdepth
-    onefile=""
-    onenumsep=0
-    for onefile in filelist:
-        onenumsep = onefile.count('/')
-        if (onenumsep >= minnumsep) and (onenumsep <= maxnumsep):
-            paredfilelist.append(onefile)
+    for (onedir, depth, subdirs, files) in _walk_to_depth(existdir, maxdepth-1):
+        if (depth+1 >= mindepth) and (depth+1 <= maxdepth):
+            for onefile in files:
+                paredfilelist.append(os.path.join(onedir, onefile))
     paredfilelist.sort()
     if not matchme == "":
-        matchfilelist=[]
         if not matchme[0] == "*":
             matchme="*"+matchme
+        matchre = re.compile(fnmatch.translate(matchme))
+        matchfilelist=[]
         for myfile in paredfilelist:
-            if fnmatch.fnmatch(myfile, matchme):
+            if matchre.match(myfile):
                 matchfilelist.append(myfile)
         return matchfilelist
     else:
         return paredfilelist
 
+_MAST_INSTALL_PATH = None
 def get_mast_install_path():
-    import MAST
-    return os.path.dirname(MAST.__file__)
+    global _MAST_INSTALL_PATH
+    if _MAST_INSTALL_PATH == None:
+        import MAST
+        _MAST_INSTALL_PATH = os.path.dirname(MAST.__file__)
+    return _MAST_INSTALL_PATH
 def get_mast_scratch_path():
     getpath = os.getenv('MAST_SCRATCH')
     if getpath == None:
@@ -174,11 +205,19 @@ def lock_directory(dirname, waitmax=10):
             dirname <str>: Directory name
             waitmax <int>: maximum number of 5-second waits
     """
-    if directory_is_locked(dirname):
-        wait_to_write(dirname, waitmax)
-    lockfile = open(dirname + "/mast.write_files.lock", 'wb')
-    lockfile.writelines(time.ctime())
-    lockfile.close()
+    lockname = dirname + "/mast.write_files.lock"
+    while True:
+        try:
+            #O_EXCL makes checking for and taking the lock one step
+            lockfd = os.open(lockname, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except OSError as e:
+            if not (e.errno == errno.EEXIST):
+                raise
+            wait_to_write(dirname, waitmax)
+            continue
+        os.write(lockfd, time.ctime())
+        os.close(lockfd)
+        return
 
 def unlock_directory(dirname, waitmax=10):
     """Unlock a directory by removing the lockfile.
@@ -204,16 +243,19 @@ def unlock_directory(dirname, waitmax=10):
 
 def wait_to_write(dirname, waitmax=10):
     """Wait to write to directory.
+        The lock is checked after short waits that lengthen to
+        5 seconds, so a lock released quickly costs little.
         Args:
             dirname <str>: Directory name
             waitmax <int>: maximum number of 5-second waits
     """
     if waitmax < 1:
         waitmax = 1
-    waitcount = 1
-    while directory_is_locked(dirname) and (waitcount < waitmax):
-        time.sleep(5)
-        waitcount = waitcount + 1
+    waituntil = time.time() + 5*(waitmax-1)
+    waitstep = 0.05
+    while directory_is_locked(dirname) and (time.time() < waituntil):
+        time.sleep(min(waitstep, max(0, waituntil - time.time())))
+        waitstep = min(2*waitstep, 5)
     if directory_is_locked(dirname):
         raise MASTError("utility wait_to_write", 
             "Timed out waiting to obtain lock on directory %s" % dirname)
@@ -241,18 +283,18 @@ def search_for_metadata_file(metastring="",dirname="", metafilename="metadata.tx
         onesplit=metaitem.strip().split("=")
         metaparse[onesplit[0].strip()]=onesplit[1].strip()
     metamatch=list()
-    mustmatch=len(metaparse.keys())
+    metatags=metaparse.keys()
     for mtry in allmetas:
-        mokay=0
+        mokay=1
         mymeta = Metadata(metafile=mtry)
-        for metatag,metaval in metaparse.iteritems():
-            searchresult = mymeta.search_data(metatag)
-            if searchresult[1] == metaval:
-                mokay=mokay+1
-            else:
+        metadict = mymeta.read_data_dict(metatags) #one read per file
+        for metatag in metatags:
+            if not (metadict[metatag] == metaparse[metatag]):
+                mokay=0
                 if verbose == 1:
-                    print metatag, searchresult
-        if mokay == mustmatch:
+                    print metatag, metadict[metatag]
+                break
+        if mokay == 1:
             metamatch.append(mtry)
     if verbose==1:
         print allmetas
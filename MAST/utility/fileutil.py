@@ -4,6 +4,7 @@
 # Maintainer: Tam Mayeshiba
 # Last updated: 2014-04-25
 ##############################################################
+import os
 import sys
 import fnmatch
 import time
@@ -23,14 +24,19 @@ def grepme(filename="", grepstr="", lastlines=""):
         Returns:
             Grep results as a list of strings
     """
+    #run grep (and tail) directly rather than through a shell
     if lastlines == "":
-        grepcmd = 'grep "%s" %s' % (grepstr, filename)
+        grepproc = subprocess.Popen(['grep', grepstr, filename], stdout = subprocess.PIPE, stderr = subprocess.PIPE)
     else:
         lastlines = str(lastlines)
-        grepcmd = 'tail -n %s %s | grep "%s"' % (lastlines, filename, grepstr)
-    #print "GREP CMD: %s" % grepcmd
-    grepproc = subprocess.Popen(grepcmd, shell=True, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+        tailerr = open(os.devnull, 'w') #nothing reads tail's stderr
+        tailproc = subprocess.Popen(['tail', '-n', lastlines, filename], stdout = subprocess.PIPE, stderr = tailerr)
+        grepproc = subprocess.Popen(['grep', grepstr], stdin = tailproc.stdout, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+        tailproc.stdout.close() #grep now holds the only read end
     grepcomm = grepproc.communicate()[0]
+    if not (lastlines == ""):
+        tailproc.wait()
+        tailerr.close()
     grepresults = grepcomm.split("\n")
     grepresults.remove("") #Remove trailing carriage return
     return grepresults
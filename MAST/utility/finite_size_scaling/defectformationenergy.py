@@ -55,7 +55,7 @@ class DefectFormationEnergy:
                 shutil.copy(CARs[i],'POSCAR')
                 Ele = pmg.Structure.from_file('POSCAR').species
                 ele = dict()
-                os.system('rm POSCAR')
+                os.remove('POSCAR')
                 for k in range(len(Ele)): 
                     if not Ele[k] in ele.keys():
                         ele[Ele[k]] = 1
@@ -37,6 +37,22 @@ class Metadata(MASTObj):
                     self.clear_data(keyword)
                     metafile.write('%s = %s\n' % (keyword, data))
 
+    def write_bulk(self, datalist):
+        """Writes several keywords and their data to the metafile.
+            A new or empty metafile is written with a single open;
+            otherwise each pair goes through write_data.
+            Args:
+                datalist <list of (str, data)>: keyword and data pairs,
+                    written in order
+        """
+        metaname = self.keywords['metafile']
+        if os.path.isfile(metaname) and os.path.getsize(metaname) > 0:
+            for (keyword, data) in datalist:
+                self.write_data(keyword, data)
+            return
+        with open(metaname, 'a') as metafile:
+            metafile.write(''.join(['%s = %s\n' % (keyword, data) for (keyword, data) in datalist]))
+
     def search_data(self, keyword):
         """Searches the file for a keyword, and if found returns the line number
             and data for that keyword.
@@ -57,6 +73,28 @@ class Metadata(MASTObj):
 
         return line_number, data
 
+    def read_data_dict(self, keywords):
+        """Searches the metadata file for several keywords with a
+            single read of the file. Keywords match as in search_data.
+            Args:
+                keywords <list of str>: keywords to search for
+            Returns:
+                <dict>: keyword -> data (None if not found)
+        """
+        with open(self.keywords['metafile'], 'r') as metafile:
+            metatext = metafile.read()
+        lines = metatext.split('\n')
+        lowerlines = metatext.lower().split('\n') #lower-case once, not per keyword
+        datadict = dict()
+        for keyword in keywords:
+            datadict[keyword] = None
+            searchkey = keyword.lower() + ' = '
+            for n, lowerline in enumerate(lowerlines):
+                if searchkey in lowerline:
+                    datadict[keyword] = lines[n].split(' = ')[1].strip()
+                    break
+        return datadict
+
     def read_data(self, keyword):
         """Searches the metadata file for a specific keyword and returns the
             data.